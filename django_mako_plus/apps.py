@@ -75,6 +75,12 @@ class Config(AppConfig):
             self.engine.get_template_loader(app, 'scripts', create=True)
             self.engine.get_template_loader(app, 'styles', create=True)
 
+            # discover the app's views now rather than on the first request to each page
+            # (views are only cached in production mode, so there's no point otherwise)
+            if self.options['PRELOAD_VIEWS'] and not settings.DEBUG:
+                from .router.discover import preload_view_functions
+                preload_view_functions(app)
+
             # send the registration signal
             if self.options['SIGNALS']:
                 dmp_signal_register_app.send(sender=self, app_config=app)
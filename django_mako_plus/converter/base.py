@@ -1,5 +1,6 @@
 from django.core.exceptions import ImproperlyConfigured
 from django.http import Http404
+from django.views.generic import View
 
 from ..util import log
 from ..exceptions import ConverterHttp404, ConverterException, BaseRedirectException
@@ -8,10 +9,78 @@ from .info import ConverterFunctionInfo
 
 import logging
 import inspect
+from collections import namedtuple
 from operator import attrgetter
 import functools
 
 
+# the subset of inspect.Parameter that the converter reads
+SignatureParameter = namedtuple('SignatureParameter', [ 'name', 'kind', 'annotation', 'default' ])
+
+
+def _code_parameters(func):
+    '''
+    Reads the parameters of a plain Python function directly from its code object,
+    defaults, and annotations.  This gives the same result as inspect.signature()
+    without building the Signature/Parameter object graph.
+    '''
+    code = func.__code__
+    names = code.co_varnames
+    num_positional = code.co_argcount
+    num_positional_only = getattr(code, 'co_posonlyargcount', 0)
+    num_keyword_only = code.co_kwonlyargcount
+    annotations = func.__annotations__
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    empty = inspect.Parameter.empty
+
+    # co_varnames order is: positional, keyword-only, *args, **kwargs
+    params = []
+    first_default = num_positional - len(defaults)
+    for i in range(num_positional):
+        params.append(SignatureParameter(
+            names[i],
+            inspect.Parameter.POSITIONAL_ONLY if i < num_positional_only else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            annotations.get(names[i], empty),
+            defaults[i - first_default] if i >= first_default else empty,
+        ))
+    var_i = num_positional + num_keyword_only
+    if code.co_flags & inspect.CO_VARARGS:
+        params.append(SignatureParameter(names[var_i], inspect.Parameter.VAR_POSITIONAL, annotations.get(names[var_i], empty), empty))
+        var_i += 1
+    for name in names[num_positional:num_positional + num_keyword_only]:
+        params.append(SignatureParameter(name, inspect.Parameter.KEYWORD_ONLY, annotations.get(name, empty), kwdefaults.get(name, empty)))
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        params.append(SignatureParameter(names[var_i], inspect.Parameter.VAR_KEYWORD, annotations.get(names[var_i], empty), empty))
+    return tuple(params)
+
+
+def _inspect_parameters(func):
+    # same unwrapping as inspect.signature: a plain function at the end of the
+    # chain (the usual @view_function case) can be read from its code object
+    real_func = inspect.unwrap(func, stop=lambda f: hasattr(f, '__signature__') or inspect.ismethod(f))
+    if inspect.isfunction(real_func) and not hasattr(real_func, '__signature__'):
+        return _code_parameters(real_func)
+    return tuple(inspect.signature(func).parameters.values())
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_signature_parameters(func):
+    return _inspect_parameters(func)
+
+
+def signature_parameters(func):
+    '''
+    Returns the parameters (name, kind, annotation, default) of func.  Converters are
+    created for every view lookup in DEBUG mode, so the signatures are memoized.
+    '''
+    # decorated class-based methods arrive as a new partial on every
+    # attribute access (see BaseDecorator.__get__), so caching them is pointless
+    if isinstance(func, functools.partial):
+        return _inspect_parameters(func)
+    return _cached_signature_parameters(func)
+
+
 class ParameterConverter(object):
     '''
     Converts parameters using functions registered to types they convert.
@@ -52,15 +121,29 @@ class ParameterConverter(object):
         else:  # class-based view
             for http_mthd in view_class.http_method_names:
                 func = getattr(view_class, http_mthd, None)
-                if func is not None:
+                # skip the handlers inherited from View itself, like options() -- they take no urlparams
+                if func is not None and func is not getattr(View, http_mthd, None):
                     self.view_parameters[http_mthd] = self._collect_parameters(func, True)
             # Django's View class aliases head to get using this logic
             if 'get' in self.view_parameters and 'head' not in self.view_parameters:
                 self.view_parameters['head'] = self.view_parameters['get']
 
+        # the parameters that are actually converted, precomputed so the per-request
+        # loop doesn't have to skip the request object, *args, and **kwargs each time.
+        # keyed by uppercase method so request.method (always uppercase) can be used as is.
+        self.conversion_plans = {
+            key.upper() if key is not None else None: tuple(
+                p for p in parameters
+                if p.position > 0 and p.kind is not inspect.Parameter.VAR_POSITIONAL and p.kind is not inspect.Parameter.VAR_KEYWORD
+            )
+            for key, parameters in self.view_parameters.items()
+        }
+        # function views use the None plan for every method; class-based views have no None plan
+        self.default_plan = self.conversion_plans.get(None, ())
+
 
     def _collect_parameters(self, func, class_based=False):
-        func_parameters = list(inspect.signature(func).parameters.values())
+        func_parameters = signature_parameters(func)
         # when using class-based views, methods that have decorators might be partials,
         # which makes it difficult to know whether the `self` parameter is present.
         # this heuristic is the best way I can figure out to skip the self parameter if there.
@@ -105,31 +188,30 @@ class ParameterConverter(object):
         function of the class.
         '''
         args = list(args)
-        urlparam_i = 0
-
-        parameters = self.view_parameters.get(request.method.lower()) or self.view_parameters.get(None)
-        if parameters is not None:
-            # add urlparams into the arguments and convert the values
-            for parameter_i, parameter in enumerate(parameters):
-                # skip request object, *args, **kwargs
-                if parameter_i == 0 or parameter.kind is inspect.Parameter.VAR_POSITIONAL or parameter.kind is inspect.Parameter.VAR_KEYWORD:
-                    pass
-                # value in kwargs?
-                elif parameter.name in kwargs:
-                    kwargs[parameter.name] = self.convert_value(kwargs[parameter.name], parameter, request)
-                # value in args?
-                elif parameter_i - 1 < len(args):
-                    args[parameter_i - 1] = self.convert_value(args[parameter_i - 1], parameter, request)
-                # urlparam value?
-                elif urlparam_i < len(request.dmp.urlparams):
-                    kwargs[parameter.name] = self.convert_value(request.dmp.urlparams[urlparam_i], parameter, request)
-                    urlparam_i += 1
-                # can we assign a default value?
-                elif parameter.default is not inspect.Parameter.empty:
-                    kwargs[parameter.name] = self.convert_value(parameter.default, parameter, request)
-                # fallback is None
-                else:
-                    kwargs[parameter.name] = self.convert_value(None, parameter, request)
+
+        # locals for the loop below, which runs for every parameter on every request
+        convert_value = self.convert_value
+        num_args = len(args)
+        # urlparams are consumed in order, so a single pass over the list is enough
+        urlparams = iter(request.dmp.urlparams)
+        empty = inspect.Parameter.empty
+
+        # add urlparams into the arguments and convert the values
+        for parameter in self.conversion_plans.get(request.method, self.default_plan):
+            name = parameter.name
+            # value in kwargs?
+            if name in kwargs:
+                kwargs[name] = convert_value(kwargs[name], parameter, request)
+            # value in args?
+            elif parameter.position - 1 < num_args:
+                args[parameter.position - 1] = convert_value(args[parameter.position - 1], parameter, request)
+            else:
+                # urlparam value? (urlparams are always strings, so `empty` can't be a real value)
+                value = next(urlparams, empty)
+                # can we assign a default value?  fallback is None
+                if value is empty:
+                    value = parameter.default if parameter.default is not empty else None
+                kwargs[name] = convert_value(value, parameter, request)
 
         return args, kwargs
 
@@ -182,7 +264,7 @@ class ParameterConverter(object):
             # if we get here, there wasn't a converter or this type
             raise ImproperlyConfigured(message='No parameter converter exists for type: {}. Do you need to add an @parameter_converter function for the type?'.format(parameter.type))
 
-        except (BaseRedirectException, Http404):
+        except (BaseRedirectException, Http404) as e:
             log.info('Exception raised during conversion of parameter %s (%s): %s', parameter.position, parameter.name, e)
             raise   # allow these to pass through to the router
 
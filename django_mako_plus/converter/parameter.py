@@ -8,6 +8,10 @@ class ViewParameter(object):
     An instance of this class is created for each parameter in a view function
     (except the initial request object argument).
     '''
+    # these are read for every parameter on every request, and there is
+    # one per view parameter across the project, so no per-instance __dict__
+    __slots__ = ( 'name', 'position', 'kind', 'type', 'default' )
+
     def __init__(self, name, position, kind, type, default):
         '''
         name:      The name of the parameter.
@@ -44,6 +44,10 @@ DEFAULT_OPTIONS = {
     # determines whether DMP will send its custom signals during the process
     'SIGNALS': False,
 
+    # whether to discover (and cache) the views of each DMP app when it is registered rather than
+    # on the first request to each page -- only takes effect in production mode (DEBUG=False)
+    'PRELOAD_VIEWS': True,
+
     # static file providers (see "static file" docs for full options here)
     'CONTENT_PROVIDERS': [
         # adds JS context - this should normally be listed FIRST
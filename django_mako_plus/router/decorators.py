@@ -14,6 +14,15 @@ import functools
 # key we use to attach the converter to the view function (also see discover.py)
 CONVERTER_ATTRIBUTE_NAME = 'parameter_converter'
 
+# the sender of our signals (this module), bound once rather than looked up on each send
+SIGNAL_SENDER = sys.modules[__name__]
+
+# the valid return types of a view function
+RESPONSE_TYPES = ( HttpResponse, StreamingHttpResponse )
+
+# the most InternalRedirectExceptions a single request can follow (stops redirect cycles)
+MAX_INTERNAL_REDIRECTS = 20
+
 
 ##########################################
 ###   View-function decorator
@@ -91,62 +100,71 @@ class RequestViewWrapper(object):
     def __call__(self, request, *args, **kwargs):
         log.info('%s', self.routing_data)
         dmp = apps.get_app_config('django_mako_plus')
+        signals_enabled = dmp.options['SIGNALS']
 
         # the middleware attaches the routing data to request.dmp, but the
         # middleware is optional. let's attach it here again for those not
         # using the middleware
         request.dmp = self.routing_data
 
-        # an outer try that catches the redirect exceptions
-        try:
-
-            # convert the parameters (the converter is placed on the func in discover.py)
-            converter = getattr(self.routing_data.callable, CONVERTER_ATTRIBUTE_NAME, None)
-            if converter is not None:
-                args, kwargs = converter.convert_parameters(request, *args, **kwargs)
-
-            # send the pre-signal
-            if dmp.options['SIGNALS']:
-                for receiver, ret_response in dmp_signal_pre_process_request.send(sender=sys.modules[__name__], request=request, view_args=args, view_kwargs=kwargs):
-                    if isinstance(ret_response, (HttpResponse, StreamingHttpResponse)):
-                        return ret_response
-
-            # call the view function
-            response = self.routing_data.callable(request, *args, **kwargs)
-            if not isinstance(response, (HttpResponse, StreamingHttpResponse)):
-                log.info('%s failed to return an HttpResponse (or the post-signal overwrote it).  Returning 500 error.', self.routing_data.callable)
-                return HttpResponseServerError('Invalid response received from server.')
-
-            # send the post-signal
-            if dmp.options['SIGNALS']:
-                for receiver, ret_response in dmp_signal_post_process_request.send(sender=sys.modules[__name__], request=request, response=response, view_args=args, view_kwargs=kwargs):
-                    if ret_response is not None:
-                        response = ret_response # sets it to the last non-None in the signal receiver chain
-
-            return response
-
-        except InternalRedirectException as ivr:
-            # send the signal
-            if dmp.options['SIGNALS']:
-                dmp_signal_internal_redirect_exception.send(sender=sys.modules[__name__], request=request, exc=ivr)
-            # update the RoutingData object
-            request.dmp.module = ivr.redirect_module
-            request.dmp.function = ivr.redirect_function
+        # internal redirects loop back around to here, so the setup above only runs once per request
+        num_internal_redirects = 0
+        while True:
+
+            # an outer try that catches the redirect exceptions
             try:
-                request.dmp.callable = getattr(import_qualified(request.dmp.module), request.dmp.function)
-            except (ImportError, AttributeError):
-                log.info('could not fulfill InternalViewRedirect because %s.%s does not exist.', request.dmp.module, request.dmp.function)
-                raise Http404()
-            # recurse with this routing data
-            log.info('received an InternalViewRedirect to %s.%s', request.dmp.module, request.dmp.function)
-            return RequestViewWrapper(self.routing_data)(request, *args, **kwargs)
-
-        except RedirectException as e: # redirect to another page
-            log.info('view %s.%s redirected processing to %s', request.dmp.module, request.dmp.function, e.redirect_to)
-            # send the signal
-            if dmp.options['SIGNALS']:
-                dmp_signal_redirect_exception.send(sender=sys.modules[__name__], request=request, exc=e)
-            # send the browser the redirect command
-            return e.get_response(request)
+
+                # convert the parameters (the converter is placed on the func in discover.py)
+                converter = getattr(self.routing_data.callable, CONVERTER_ATTRIBUTE_NAME, None)
+                if converter is not None:
+                    args, kwargs = converter.convert_parameters(request, *args, **kwargs)
+
+                # send the pre-signal
+                if signals_enabled:
+                    for receiver, ret_response in dmp_signal_pre_process_request.send(sender=SIGNAL_SENDER, request=request, view_args=args, view_kwargs=kwargs):
+                        if isinstance(ret_response, RESPONSE_TYPES):
+                            return ret_response
+
+                # call the view function
+                response = self.routing_data.callable(request, *args, **kwargs)
+                if not isinstance(response, RESPONSE_TYPES):
+                    log.info('%s failed to return an HttpResponse (or the post-signal overwrote it).  Returning 500 error.', self.routing_data.callable)
+                    return HttpResponseServerError('Invalid response received from server.')
+
+                # send the post-signal
+                if signals_enabled:
+                    for receiver, ret_response in dmp_signal_post_process_request.send(sender=SIGNAL_SENDER, request=request, response=response, view_args=args, view_kwargs=kwargs):
+                        if ret_response is not None:
+                            response = ret_response # sets it to the last non-None in the signal receiver chain
+
+                return response
+
+            except InternalRedirectException as ivr:
+                # send the signal
+                if signals_enabled:
+                    dmp_signal_internal_redirect_exception.send(sender=SIGNAL_SENDER, request=request, exc=ivr)
+                # views that redirect to each other in a cycle would otherwise loop forever
+                num_internal_redirects += 1
+                if num_internal_redirects > MAX_INTERNAL_REDIRECTS:
+                    log.info('InternalViewRedirect to %s.%s exceeded %s redirects in one request (is there a cycle?).  Returning 500 error.', ivr.redirect_module, ivr.redirect_function, MAX_INTERNAL_REDIRECTS)
+                    return HttpResponseServerError('Too many internal redirects.')
+                # update the RoutingData object
+                request.dmp.module = ivr.redirect_module
+                request.dmp.function = ivr.redirect_function
+                try:
+                    request.dmp.callable = getattr(import_qualified(request.dmp.module), request.dmp.function)
+                except (ImportError, AttributeError):
+                    log.info('could not fulfill InternalViewRedirect because %s.%s does not exist.', request.dmp.module, request.dmp.function)
+                    raise Http404()
+                # loop around to call the new view with this routing data
+                log.info('received an InternalViewRedirect to %s.%s', request.dmp.module, request.dmp.function)
+
+            except RedirectException as e: # redirect to another page
+                log.info('view %s.%s redirected processing to %s', request.dmp.module, request.dmp.function, e.redirect_to)
+                # send the signal
+                if signals_enabled:
+                    dmp_signal_redirect_exception.send(sender=SIGNAL_SENDER, request=request, exc=e)
+                # send the browser the redirect command
+                return e.get_response(request)
 
         # the code should never get here
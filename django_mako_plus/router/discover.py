@@ -1,13 +1,17 @@
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ViewDoesNotExist
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.template import TemplateDoesNotExist
 from django.views.generic import View
 
 from .decorators import view_function, CONVERTER_ATTRIBUTE_NAME
 from ..util import import_qualified, log
 
+import functools
 import inspect
+import pkgutil
 import threading
 from importlib import import_module
 from importlib.util import find_spec
@@ -21,13 +25,34 @@ CACHED_VIEW_FUNCTIONS = {}
 rlock = threading.RLock()
 
 
+@functools.lru_cache(maxsize=512)
+def cached_find_spec(module_name):
+    '''
+    Memoized find_spec that returns None when the module doesn't exist.
+    Only used in production mode so new view files are found during development.
+    '''
+    try:
+        return find_spec(module_name)
+    except ValueError:
+        return None
+
+
+@receiver(setting_changed)
+def clear_view_caches(**kwargs):
+    '''Clears the discovery caches when settings change (e.g. override_settings in tests)'''
+    with rlock:
+        CACHED_VIEW_FUNCTIONS.clear()
+        cached_find_spec.cache_clear()
+
+
 def get_view_function(module_name, function_name, fallback_app=None, fallback_template=None, verify_decorator=True):
     '''
     Retrieves a view function from the cache, finding it if the first time.
     Raises ViewDoesNotExist if not found.  This is called by resolver.py.
     '''
     # first check the cache (without doing locks)
-    key = ( module_name, function_name )
+    # the fallback is part of the key because a missing module resolves to its template
+    key = ( module_name, function_name, fallback_app, fallback_template, verify_decorator )
     try:
         return CACHED_VIEW_FUNCTIONS[key]
     except KeyError:
@@ -47,6 +72,43 @@ def get_view_function(module_name, function_name, fallback_app=None, fallback_te
     raise Exception("Django-Mako-Plus error: get_view_function() should not have been able to get to this point.  Please notify the owner of the DMP project.  Thanks.")
 
 
+def preload_view_functions(app_config):
+    '''
+    Discovers the view functions and class-based views in an app's views/ package
+    and places them in the cache, so the first request to each page doesn't pay
+    the discovery cost.  This is called by AppConfig.register_app() in production mode.
+    '''
+    package_name = '{}.views'.format(app_config.name)
+    spec = cached_find_spec(package_name)
+    if spec is None or spec.submodule_search_locations is None:
+        return
+    for _, page, ispkg in pkgutil.iter_modules(spec.submodule_search_locations):
+        if ispkg:
+            continue
+        module_name = '{}.{}'.format(package_name, page)
+        # a module that can't be imported is skipped here; requests to it report the error as usual
+        try:
+            module = import_module(module_name)
+        except ImportError as e:
+            log.warning('skipping preload of %s because it could not be imported: %s', module_name, e, exc_info=True)
+            continue
+        for function_name, func in list(vars(module).items()):
+            # only endpoints defined in this module (not imported into it)
+            if not callable(func) or getattr(func, '__module__', None) != module_name:
+                continue
+            if inspect.isclass(func):
+                if not issubclass(func, View):
+                    continue
+            elif not view_function.is_decorated(func):
+                continue
+            # the same fallback template that RoutingData uses for this page and function
+            if function_name == 'process_request':
+                fallback_template = '{}.html'.format(page)
+            else:
+                fallback_template = '{}.{}.html'.format(page, function_name)
+            get_view_function(module_name, function_name, app_config.name, fallback_template)
+
+
 def find_view_function(module_name, function_name, fallback_app=None, fallback_template=None, verify_decorator=True):
     '''
     Finds a view function, class-based view, or template view.
@@ -56,11 +118,8 @@ def find_view_function(module_name, function_name, fallback_app=None, fallback_t
 
     # I'm first calling find_spec first here beacuse I don't want import_module in
     # a try/except -- there are lots of reasons that importing can fail, and I just want to
-    # know whether the file actually exists.  find_spec raises AttributeError if not found.
-    try:
-        spec = find_spec(module_name)
-    except ValueError:
-        spec = None
+    # know whether the file actually exists.  find_spec returns None if not found.
+    spec = cached_find_spec(module_name) if not settings.DEBUG else cached_find_spec.__wrapped__(module_name)
     if spec is None:
         # no view module, so create a view function that directly renders the template
         try:
@@ -68,15 +127,21 @@ def find_view_function(module_name, function_name, fallback_app=None, fallback_t
         except TemplateDoesNotExist as e:
             raise ViewDoesNotExist('view module {} not found, and fallback template {} could not be loaded ({})'.format(module_name, fallback_template, e))
 
-    # load the module and function
+    # load the module
     try:
         module = import_module(module_name)
-        func = getattr(module, function_name)
-        func.view_type = 'function'
     except ImportError as e:
         raise ViewDoesNotExist('module "{}" could not be imported: {}'.format(module_name, e))
+
+    # load the function (getattr's default makes a missing function a normal miss)
+    func = getattr(module, function_name, None)
+    if func is None or not callable(func):
+        raise ViewDoesNotExist('module "{}" found successfully, but "{}" was not found'.format(module_name, function_name))
+    # some callables (builtins, for example) don't take new attributes, so they can't be views
+    try:
+        func.view_type = 'function'
     except AttributeError as e:
-        raise ViewDoesNotExist('module "{}" found successfully, but "{}" was not found: {}'.format(module_name, function_name, e))
+        raise ViewDoesNotExist('module "{}" found successfully, but "{}" cannot be used as a view: {}'.format(module_name, function_name, e))
 
     # if class-based view, call as_view() to get a view function to it
     if inspect.isclass(func) and issubclass(func, View):
@@ -105,12 +170,12 @@ def create_view_for_template(app_name, template_name):
     Raises TemplateDoesNotExist if the template doesn't exist.
     '''
     # ensure the template exists
-    apps.get_app_config('django_mako_plus').engine.get_template_loader(app_name).get_template(template_name)
+    template_loader = apps.get_app_config('django_mako_plus').engine.get_template_loader(app_name)
+    template_loader.get_template(template_name)
     # create the view function
     def template_view(request, *args, **kwargs):
-        # not caching the template object (getting it each time) because Mako has its own cache
-        dmp = apps.get_app_config('django_mako_plus')
-        template = dmp.engine.get_template_loader(app_name).get_template(template_name)
+        # the loader is reused, but not the template object (getting it each time) because Mako has its own cache
+        template = template_loader.get_template(template_name)
         return template.render_to_response(request=request, context=kwargs)
     template_view.view_type = 'template'
     return template_view
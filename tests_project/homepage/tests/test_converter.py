@@ -1,9 +1,17 @@
+from django.http import Http404
 from django.test import TestCase
 
+from django_mako_plus import view_function
+from django_mako_plus.converter import ParameterConverter, ViewParameter
+from django_mako_plus.converter.base import signature_parameters
 from django_mako_plus.util import log
 from homepage.models import IceCream, MyInt
+from homepage.views.converter import Raises404, raises_404_endpoint
 import datetime
 import decimal
+import inspect
+import sys
+import unittest
 
 
 class Tester(TestCase):
@@ -141,6 +149,15 @@ class Tester(TestCase):
         self.assertTrue(hasattr(req.dmp.converted_params['loc'], 'latitude'))
         self.assertTrue(hasattr(req.dmp.converted_params['loc'], 'longitude'))
 
+    def test_converter_http404(self):
+        # the converter's Http404 passes through convert_value unchanged
+        parameter = ViewParameter(name='r', position=1, kind=inspect.Parameter.POSITIONAL_OR_KEYWORD, type=Raises404, default=inspect.Parameter.empty)
+        with self.assertRaisesMessage(Http404, 'Converters can raise Http404 directly'):
+            ParameterConverter(raises_404_endpoint).convert_value('abc', parameter, None)
+        # and the router turns it into a 404 (the view itself would return a 200)
+        resp = self.client.get('/homepage/converter.raises_404_endpoint/abc/')
+        self.assertEqual(resp.status_code, 404)
+
     def test_class_based(self):
         resp = self.client.get('/homepage/converter.class_based/mystr/3/4/1/2/')
         self.assertEqual(resp.status_code, 200)
@@ -166,3 +183,23 @@ class Tester(TestCase):
         self.assertEqual(req.dmp.converted_params['f'], 4.0)
         self.assertTrue(req.dmp.converted_params['b'])
         self.assertEqual(req.dmp.converted_params['ic'], IceCream.objects.get(pk=2))
+
+    def assertSignatureParametersMatch(self, view):
+        # the code-object fast path must match inspect.signature
+        expected = [ ( p.name, p.kind, p.annotation, p.default ) for p in inspect.signature(view).parameters.values() ]
+        for func in ( view, view_function(view) ):
+            self.assertEqual([ ( p.name, p.kind, p.annotation, p.default ) for p in signature_parameters(func) ], expected)
+
+
+    def test_signature_parameters(self):
+        def view(request, s:str, i:int=1, *args, k:float, kd:bool=False, **kwargs):
+            pass
+        self.assertSignatureParametersMatch(view)
+
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'positional-only parameters require Python 3.8+')
+    def test_signature_parameters_positional_only(self):
+        # compiled from a string so the module still imports on older versions
+        namespace = {}
+        exec('def view(request, a, /, s:str, i:int=1):\n    pass', namespace)
+        self.assertSignatureParametersMatch(namespace['view'])
@@ -29,6 +29,12 @@ class Tester(TestCase):
         self.assertEqual(resp.content, b'new_location2')
 
 
+    def test_internal_redirect_exception_cycle(self):
+        # a view that redirects to itself stops after MAX_INTERNAL_REDIRECTS
+        resp = self.client.get('/homepage/redirects.internal_redirect_exception_cycle/')
+        self.assertEqual(resp.status_code, 500)
+
+
     def test_bad_internal_redirect_exception(self):
         resp = self.client.get('/homepage/redirects.bad_internal_redirect_exception/')
         self.assertEqual(resp.status_code, 404)
@@ -1,5 +1,10 @@
+from django.apps import apps
 from django.test import TestCase
 
+from unittest import mock
+
+from django_mako_plus.router.discover import get_view_function, preload_view_functions, CACHED_VIEW_FUNCTIONS
+
 
 
 
@@ -30,6 +35,12 @@ class Tester(TestCase):
         self.assertEqual(resp.status_code, 404)
 
 
+    def test_not_a_function(self):
+        # module attributes that aren't view functions are misses, not errors
+        resp = self.client.get('/homepage/index.__name__/')
+        self.assertEqual(resp.status_code, 404)
+
+
     def test_bad_response(self):
         resp = self.client.get('/homepage/index.bad_response/1/2/3/')
         self.assertEqual(resp.status_code, 500)
@@ -79,3 +90,45 @@ class Tester(TestCase):
         self.assertEqual(req.dmp.urlparams[0], '1')
         self.assertEqual(req.dmp.urlparams[1], '2')
         self.assertEqual(req.dmp.urlparams[2], '3')
+
+
+    def test_view_function_cache(self):
+        func = get_view_function('homepage.views.index', 'basic', 'homepage', 'index.basic.html')
+        self.assertIs(func, get_view_function('homepage.views.index', 'basic', 'homepage', 'index.basic.html'))
+        # template-only views must not share a cache entry across fallback templates
+        func1 = get_view_function('homepage.views.templateonly', 'process_request', 'homepage', 'index.html')
+        func2 = get_view_function('homepage.views.templateonly', 'process_request', 'homepage', 'index.basic.html')
+        self.assertEqual(func1.view_type, 'template')
+        self.assertIsNot(func1, func2)
+
+
+    def test_view_function_cache_cleared(self):
+        func = get_view_function('homepage.views.templateonly', 'process_request', 'homepage', 'index.html')
+        with self.settings(DEBUG=False):
+            self.assertIsNot(func, get_view_function('homepage.views.templateonly', 'process_request', 'homepage', 'index.html'))
+
+
+    def test_preload_view_functions(self):
+        # override_settings clears the view caches on the way in and out (see clear_view_caches)
+        with self.settings(DEBUG=False):
+            preload_view_functions(apps.get_app_config('homepage'))
+            # same keys that RoutingData uses for /homepage/index/ and /homepage/index.class_based/
+            self.assertIn(('homepage.views.index', 'process_request', 'homepage', 'index.html', True), CACHED_VIEW_FUNCTIONS)
+            self.assertIn(('homepage.views.index', 'class_based', 'homepage', 'index.class_based.html', True), CACHED_VIEW_FUNCTIONS)
+            # undecorated functions are not endpoints
+            self.assertNotIn(('homepage.views.redirects', 'internal_redirect_exception2', 'homepage', 'redirects.internal_redirect_exception2.html', True), CACHED_VIEW_FUNCTIONS)
+
+
+    def test_preload_views_option(self):
+        dmp = apps.get_app_config('django_mako_plus')
+        key = ('homepage.views.index', 'process_request', 'homepage', 'index.html', True)
+        with self.settings(DEBUG=False):
+            # register_app short circuits for registered apps, so unregister homepage for the test
+            with mock.patch.dict(dmp.registered_apps), mock.patch.dict(dmp.options, {'PRELOAD_VIEWS': False}):
+                del dmp.registered_apps['homepage']
+                dmp.register_app('homepage')
+                self.assertNotIn(key, CACHED_VIEW_FUNCTIONS)
+            with mock.patch.dict(dmp.registered_apps), mock.patch.dict(dmp.options, {'PRELOAD_VIEWS': True}):
+                del dmp.registered_apps['homepage']
+                dmp.register_app('homepage')
+                self.assertIn(key, CACHED_VIEW_FUNCTIONS)
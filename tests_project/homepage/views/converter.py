@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, Http404
 from django.views.generic import View
 from django_mako_plus import view_function, parameter_converter
 
@@ -43,6 +43,20 @@ def geo_location_endpoint(request, loc:GeoLocation):
     return HttpResponse('{}, {}'.format(loc.latitude, loc.longitude))
 
 
+class Raises404(object):
+    pass
+
+
+@parameter_converter(Raises404)
+def convert_raises_404(value, parameter):
+    raise Http404('Converters can raise Http404 directly')
+
+
+@view_function
+def raises_404_endpoint(request, r:Raises404):
+    return HttpResponse('Should have been a 404.')
+
+
 ###  Class-based views  ###
 
 class class_based(View):
@@ -38,6 +38,10 @@ def javascript_redirect_exception(request):
 def internal_redirect_exception(request):
     raise InternalRedirectException('homepage.views.redirects', 'internal_redirect_exception2')
 
+@view_function
+def internal_redirect_exception_cycle(request):
+    raise InternalRedirectException('homepage.views.redirects', 'internal_redirect_exception_cycle')
+
 @view_function
 def bad_internal_redirect_exception(request):
     raise InternalRedirectException('homepage.non_existent', 'internal_redirect_exception2')